@@ -76,113 +76,119 @@ class ComputerLanguage(ContextEntity):
 # See https://w3id.org/workflowhub/workflow-ro-crate/1.0
 # (note that it does not specify "version")
 
+# Property templates for the known languages. They are copied on each call,
+# including nested dicts, so entities never share mutable state.
+
+CWL_ID = "https://w3id.org/workflowhub/workflow-ro-crate#cwl"
+CWL_IDENTIFIER = "https://w3id.org/cwl/"
+_CWL_PROPERTIES = {
+    "name": "Common Workflow Language",
+    "alternateName": "CWL",
+    "identifier": {
+        "@id": CWL_IDENTIFIER
+    },
+    "url": {
+        "@id": "https://www.commonwl.org/"
+    },
+}
 
-def cwl(crate, version=None):
-    id_ = "https://w3id.org/workflowhub/workflow-ro-crate#cwl"
-    identifier = "https://w3id.org/cwl/"
-    if version:
-        identifier = f"{identifier}v{version.lstrip('v')}/"
-    properties = {
-        "name": "Common Workflow Language",
-        "alternateName": "CWL",
-        "identifier": {
-            "@id": identifier
-        },
-        "url": {
-            "@id": "https://www.commonwl.org/"
-        },
+GALAXY_ID = "https://w3id.org/workflowhub/workflow-ro-crate#galaxy"
+_GALAXY_PROPERTIES = {
+    "name": "Galaxy",
+    "identifier": {
+        "@id": "https://galaxyproject.org/"
+    },
+    "url": {
+        "@id": "https://galaxyproject.org/"
     }
-    if version:
-        properties["version"] = version
-    return ComputerLanguage(crate, identifier=id_, properties=properties)
+}
 
+KNIME_ID = "https://w3id.org/workflowhub/workflow-ro-crate#knime"
+_KNIME_PROPERTIES = {
+    "name": "KNIME",
+    "identifier": {
+        "@id": "https://www.knime.com/"
+    },
+    "url": {
+        "@id": "https://www.knime.com/"
+    }
+}
 
-def galaxy(crate, version=None):
-    id_ = "https://w3id.org/workflowhub/workflow-ro-crate#galaxy"
-    properties = {
-        "name": "Galaxy",
-        "identifier": {
-            "@id": "https://galaxyproject.org/"
-        },
-        "url": {
-            "@id": "https://galaxyproject.org/"
-        }
+NEXTFLOW_ID = "https://w3id.org/workflowhub/workflow-ro-crate#nextflow"
+_NEXTFLOW_PROPERTIES = {
+    "name": "Nextflow",
+    "identifier": {
+        "@id": "https://www.nextflow.io/"
+    },
+    "url": {
+        "@id": "https://www.nextflow.io/"
     }
+}
+
+SNAKEMAKE_ID = "https://w3id.org/workflowhub/workflow-ro-crate#snakemake"
+_SNAKEMAKE_PROPERTIES = {
+    "name": "Snakemake",
+    "identifier": {
+        "@id": "https://doi.org/10.1093/bioinformatics/bts480"
+    },
+    "url": {
+        "@id": "https://snakemake.readthedocs.io"
+    }
+}
+
+COMPSS_ID = "#compss"
+_COMPSS_PROPERTIES = {
+    "name": "COMPSs Programming Model",
+    "alternateName": "COMPSs",
+    "url": "http://compss.bsc.es/",
+    "citation": "https://doi.org/10.1007/s10723-013-9272-5"
+}
+
+AUTOSUBMIT_ID = "#autosubmit"
+_AUTOSUBMIT_PROPERTIES = {
+    "name": "Autosubmit",
+    "alternateName": "AS",
+    "url": "https://autosubmit.readthedocs.io/",
+    "citation": "https://doi.org/10.1109/HPCSim.2016.7568429"
+}
+
+
+def _from_template(crate, identifier, template, version=None):
+    properties = {k: v.copy() if isinstance(v, dict) else v for k, v in template.items()}
     if version:
         properties["version"] = version
-    return ComputerLanguage(crate, identifier=id_, properties=properties)
+    return ComputerLanguage(crate, identifier=identifier, properties=properties)
 
 
-def knime(crate, version=None):
-    id_ = "https://w3id.org/workflowhub/workflow-ro-crate#knime"
-    properties = {
-        "name": "KNIME",
-        "identifier": {
-            "@id": "https://www.knime.com/"
-        },
-        "url": {
-            "@id": "https://www.knime.com/"
-        }
-    }
+def cwl(crate, version=None):
+    lang = _from_template(crate, CWL_ID, _CWL_PROPERTIES, version=version)
     if version:
-        properties["version"] = version
-    return ComputerLanguage(crate, identifier=id_, properties=properties)
+        lang["identifier"] = {"@id": f"{CWL_IDENTIFIER}v{version.lstrip('v')}/"}
+    return lang
+
+
+def galaxy(crate, version=None):
+    return _from_template(crate, GALAXY_ID, _GALAXY_PROPERTIES, version=version)
+
+
+def knime(crate, version=None):
+    return _from_template(crate, KNIME_ID, _KNIME_PROPERTIES, version=version)
 
 
 def nextflow(crate, version=None):
-    id_ = "https://w3id.org/workflowhub/workflow-ro-crate#nextflow"
-    properties = {
-        "name": "Nextflow",
-        "identifier": {
-            "@id": "https://www.nextflow.io/"
-        },
-        "url": {
-            "@id": "https://www.nextflow.io/"
-        }
-    }
-    if version:
-        properties["version"] = version
-    return ComputerLanguage(crate, identifier=id_, properties=properties)
+    return _from_template(crate, NEXTFLOW_ID, _NEXTFLOW_PROPERTIES, version=version)
 
 
 def snakemake(crate, version=None):
-    id_ = "https://w3id.org/workflowhub/workflow-ro-crate#snakemake"
-    properties = {
-        "name": "Snakemake",
-        "identifier": {
-            "@id": "https://doi.org/10.1093/bioinformatics/bts480"
-        },
-        "url": {
-            "@id": "https://snakemake.readthedocs.io"
-        }
-    }
-    if version:
-        properties["version"] = version
-    return ComputerLanguage(crate, identifier=id_, properties=properties)
+    return _from_template(crate, SNAKEMAKE_ID, _SNAKEMAKE_PROPERTIES, version=version)
 
 
 def compss(crate, version=None):
-    properties = {
-        "name": "COMPSs Programming Model",
-        "alternateName": "COMPSs",
-        "url": "http://compss.bsc.es/",
-        "citation": "https://doi.org/10.1007/s10723-013-9272-5"
-    }
-    if version:
-        properties["version"] = version
-    return ComputerLanguage(crate, identifier="#compss", properties=properties)
+    return _from_template(crate, COMPSS_ID, _COMPSS_PROPERTIES, version=version)
 
 
 def autosubmit(crate, version=None):
-    properties = {
-        "name": "Autosubmit",
-        "alternateName": "AS",
-        "url": "https://autosubmit.readthedocs.io/",
-        "citation": "https://doi.org/10.1109/HPCSim.2016.7568429"
-    }
-    if version:
-        properties["version"] = version
-    return ComputerLanguage(crate, identifier="#autosubmit", properties=properties)
+    return _from_template(crate, AUTOSUBMIT_ID, _AUTOSUBMIT_PROPERTIES, version=version)
 
 
 LANG_MAP = {
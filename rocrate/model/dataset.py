@@ -24,13 +24,69 @@
 
 import errno
 import os
+import shutil
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.request import urlopen
-from urllib.parse import unquote
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen, url2pathname
+from urllib.parse import unquote, urlsplit
 
 from .file_or_dir import FileOrDir
-from ..utils import is_url, iso_now
+from ..utils import is_url, iso_now, COPY_BUFSIZE
+
+
+# maximum number of remote parts downloaded concurrently
+MAX_FETCH_WORKERS = 8
+
+
+def _iter_files(top):
+    """\
+    Recursively yield the paths of all files under top, in the same order as
+    os.walk. Symbolic links to directories are not followed, and directories
+    that can't be listed are skipped (as os.walk does by default).
+    """
+    files, subdirs = [], []
+    try:
+        with os.scandir(top) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    files.append(entry.path)
+    except OSError:
+        return
+    yield from files
+    for d in subdirs:
+        yield from _iter_files(d)
+
+
+def _parent_prefix_len(top):
+    """\
+    Length of the prefix to strip from paths under top to make them relative
+    to top's parent directory. The parent may already end with a separator
+    (e.g., for "/data" or "C:\\data").
+    """
+    return len(os.path.join(os.path.dirname(top), ""))
+
+
+def _download(url, out_file_path):
+    out_file_path.parent.mkdir(parents=True, exist_ok=True)
+    parts = urlsplit(url)
+    if parts.scheme == "file" and parts.netloc in ("", "localhost"):
+        # local file: let shutil pick the fastest copy (e.g. sendfile on Linux)
+        source = url2pathname(parts.path)
+        try:
+            shutil.copyfile(source, out_file_path)
+        except OSError as e:
+            if e.filename != source:
+                raise
+            # same error as urlopen (and Dataset.stream) for an unreadable part
+            raise URLError(e) from e
+        return
+    with urlopen(url) as response, open(out_file_path, 'wb') as out_file:
+        shutil.copyfileobj(response, out_file, COPY_BUFSIZE)
 
 
 class Dataset(FileOrDir):
@@ -48,21 +104,15 @@ class Dataset(FileOrDir):
 
     def _write_from_url(self, base_path):
         if self.validate_url and not self.fetch_remote:
-            with urlopen(self.source) as _:
-                self._jsonld['sdDatePublished'] = iso_now()
+            self._validate_source_url()
         if self.fetch_remote:
-            out_file_path, out_file = None, None
-            for rel_path, chunk in self._stream_folder_from_url():
-                path = base_path / rel_path
-                if path != out_file_path:
-                    if out_file:
-                        out_file.close()
-                    out_file_path = Path(path)
-                    out_file_path.parent.mkdir(parents=True, exist_ok=True)
-                    out_file = open(out_file_path, 'wb')
-                out_file.write(chunk)
-            if out_file:
-                out_file.close()
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                futures = [
+                    executor.submit(_download, part_uri, base_path / rel_path)
+                    for rel_path, part_uri in self._iter_parts_from_url()
+                ]
+                for f in futures:
+                    f.result()
 
     def _copy_folder(self, base_path):
         abs_out_path = base_path / unquote(self.id)
@@ -80,7 +130,7 @@ class Dataset(FileOrDir):
 
     def write(self, base_path):
         base_path = Path(base_path)
-        if is_url(str(self.source)):
+        if self._source_is_url:
             self._write_from_url(base_path)
         else:
             self._copy_folder(base_path)
@@ -88,7 +138,7 @@ class Dataset(FileOrDir):
     def stream(self, chunk_size=8192):
         if self.source is None:
             return
-        elif is_url(str(self.source)):
+        elif self._source_is_url:
             yield from self._stream_folder_from_url(chunk_size)
         else:
             yield from self._stream_folder_from_path(chunk_size)
@@ -100,44 +150,74 @@ class Dataset(FileOrDir):
                 errno.ENOENT, os.strerror(errno.ENOENT), str(path)
             )
         if not self.crate.source:
-            for root, _, files in os.walk(path):
-                root = Path(root)
-                for name in files:
-                    source = root / name
-                    dest = source.relative_to(Path(path).parent)
-                    is_empty = True
-                    with open(source, 'rb') as f:
-                        while chunk := f.read(chunk_size):
-                            is_empty = False
-                            yield str(dest), chunk
-
-                    # yield once for an empty file
-                    if is_empty:
-                        yield str(dest), b""
+            top = os.path.normpath(path)
+            prefix_len = _parent_prefix_len(top)
+            for source in _iter_files(top):
+                dest = source[prefix_len:]
+                is_empty = True
+                with open(source, 'rb', buffering=COPY_BUFSIZE) as f:
+                    while chunk := f.read(chunk_size):
+                        is_empty = False
+                        yield dest, chunk
+
+                # yield once for an empty file
+                if is_empty:
+                    yield dest, b""
 
     def _stream_folder_from_url(self, chunk_size=8192):
         if not self.fetch_remote:
             if self.validate_url:
+                self._validate_source_url()
+        else:
+            for rel_out_path, response in self._open_parts_from_url():
+                is_empty = True
+                while chunk := response.read(chunk_size):
+                    is_empty = False
+                    yield str(rel_out_path), chunk
+
+                # yield once for an empty file
+                if is_empty:
+                    yield str(rel_out_path), b""
+
+    def _validate_source_url(self):
+        # for http(s), a HEAD request is enough: there is no need for the body
+        if self.source.startswith("http"):
+            try:
+                with urlopen(Request(self.source, method="HEAD")) as _:
+                    pass
+            except HTTPError as e:
+                if e.code not in (405, 501):  # server doesn't allow HEAD
+                    raise
+                e.close()
                 with urlopen(self.source) as _:
-                    self._jsonld['sdDatePublished'] = iso_now()
+                    pass
         else:
-            base = self.source.rstrip("/")
-            for entry in self._jsonld.get("hasPart", []):
-                try:
-                    part = entry["@id"]
-                    if is_url(part) or part.startswith("/"):
-                        raise RuntimeError(f"'{self.source}': part '{part}' is not a relative path")
-                    part_uri = f"{base}/{part}"
-                    rel_out_path = Path(self.id) / part
-
-                    is_empty = True
-                    with urlopen(part_uri) as response:
-                        while chunk := response.read(chunk_size):
-                            is_empty = False
-                            yield str(rel_out_path), chunk
-
-                    # yield once for an empty file
-                    if is_empty:
-                        yield str(rel_out_path), b""
-                except KeyError:
-                    warnings.warn(f"'hasPart' entry in {self.id} is missing '@id'. Skipping.")
+            with urlopen(self.source) as _:
+                pass
+        self._jsonld['sdDatePublished'] = iso_now()
+
+    def _iter_parts_from_url(self):
+        """\
+        Yield a tuple for each of the dataset's parts, containing the
+        destination path relative to the crate and the URL of the part.
+        """
+        base = self.source.rstrip("/")
+        for entry in self._jsonld.get("hasPart", []):
+            try:
+                part = entry["@id"]
+            except KeyError:
+                warnings.warn(f"'hasPart' entry in {self.id} is missing '@id'. Skipping.")
+                continue
+            if is_url(part) or part.startswith("/"):
+                raise RuntimeError(f"'{self.source}': part '{part}' is not a relative path")
+            yield Path(self.id) / part, f"{base}/{part}"
+
+    def _open_parts_from_url(self):
+        """\
+        Open each of the dataset's parts in turn, yielding a tuple containing
+        the destination path relative to the crate and the response object.
+        The response is closed as soon as the caller asks for the next part.
+        """
+        for rel_path, part_uri in self._iter_parts_from_url():
+            with urlopen(part_uri) as response:
+                yield rel_path, response
@@ -25,8 +25,8 @@
 import uuid
 from collections.abc import MutableMapping
 
-from dateutil.parser import isoparse
 from .. import vocabs
+from ..utils import parse_iso
 
 
 class Entity(MutableMapping):
@@ -37,13 +37,16 @@ class Entity(MutableMapping):
             self.__id = self.format_id(identifier)
         else:
             self.__id = f"#{uuid.uuid4()}"
+        self.__canonical_id = None
+        self.__date_published = None  # (raw value, parsed value)
         self._jsonld = self._empty()
         if properties:
             for name, value in properties.items():
                 if name.startswith("@"):
                     self._jsonld[name] = value
                 else:
-                    self[name] = value
+                    # key already known not to be a keyword: skip the check
+                    self.__set(name, value)
 
     @property
     def id(self):
@@ -71,7 +74,10 @@ class Entity(MutableMapping):
         return "Thing"
 
     def canonical_id(self):
-        return self.crate.resolve_id(self.id)
+        # the id cannot change after construction, so resolve it only once
+        if self.__canonical_id is None:
+            self.__canonical_id = self.crate.resolve_id(self.__id)
+        return self.__canonical_id
 
     def __hash__(self):
         return hash(self.canonical_id())
@@ -85,31 +91,38 @@ class Entity(MutableMapping):
 
     def __getitem__(self, key):
         v = self._jsonld[key]
-        if v is None or key.startswith("@"):
+        if v is None or isinstance(v, str) or key.startswith("@"):
             return v
-        values = v if isinstance(v, list) else [v]
-        deref_values = []
-        for entry in values:
-            if isinstance(entry, dict):
-                try:
-                    id_ = entry["@id"]
-                except KeyError:
-                    raise ValueError(f"no @id in {entry}")
-                else:
-                    deref_values.append(self.crate.get(id_, id_))
-            else:
-                deref_values.append(entry)
-        return deref_values if isinstance(v, list) else deref_values[0]
+        if isinstance(v, list):
+            get = self.crate.get
+            return [self.__deref(_, get) for _ in v]
+        return self.__deref(v, self.crate.get)
+
+    @staticmethod
+    def __deref(entry, get):
+        if not isinstance(entry, dict):
+            return entry
+        try:
+            id_ = entry["@id"]
+        except KeyError:
+            raise ValueError(f"no @id in {entry}")
+        return get(id_, id_)
 
     def __setitem__(self, key: str, value):
         if key.startswith("@"):
             raise KeyError(f"cannot set '{key}'")
-        values = value if isinstance(value, list) else [value]
-        for v in values:
-            if isinstance(v, dict) and "@id" not in v:
+        self.__set(key, value)
+
+    def __set(self, key, value):
+        is_list = isinstance(value, list)
+        ref_values = []
+        for v in (value if is_list else (value,)):
+            if isinstance(v, Entity):
+                v = {"@id": v.id}
+            elif isinstance(v, dict) and "@id" not in v:
                 raise ValueError(f"no @id in {v}")
-        ref_values = [{"@id": _.id} if isinstance(_, Entity) else _ for _ in values]
-        self._jsonld[key] = ref_values if isinstance(value, list) else ref_values[0]
+            ref_values.append(v)
+        self._jsonld[key] = ref_values if is_list else ref_values[0]
 
     def __delitem__(self, key: str):
         if key.startswith("@"):
@@ -135,6 +148,8 @@ class Entity(MutableMapping):
         return key in self._jsonld
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Entity):
             return NotImplemented
         return self.id == other.id and self._jsonld == other._jsonld
@@ -146,7 +161,11 @@ class Entity(MutableMapping):
     @property
     def datePublished(self):
         d = self.get('datePublished')
-        return d if not d else isoparse(d)
+        if not d:
+            return d
+        if self.__date_published is None or self.__date_published[0] != d:
+            self.__date_published = d, parse_iso(d)
+        return self.__date_published[1]
 
     @datePublished.setter
     def datePublished(self, value):
@@ -165,8 +184,11 @@ class Entity(MutableMapping):
         current_value = self._jsonld.setdefault(key, [])
         if not isinstance(current_value, list):
             current_value = self._jsonld[key] = [current_value]
-        if not isinstance(value, list):
-            value = [value]
-        current_value.extend([{"@id": _.id} if isinstance(_, Entity) else _ for _ in value])
+        if isinstance(value, list):
+            current_value.extend({"@id": _.id} if isinstance(_, Entity) else _ for _ in value)
+        elif isinstance(value, Entity):
+            current_value.append({"@id": value.id})
+        else:
+            current_value.append(value)
         if compact and len(current_value) == 1:
             self._jsonld[key] = current_value[0]
@@ -31,7 +31,7 @@ from io import BytesIO, StringIO
 from urllib.parse import unquote
 
 from .file_or_dir import FileOrDir
-from ..utils import is_url, iso_now
+from ..utils import iso_now
 
 
 class File(FileOrDir):
@@ -46,7 +46,7 @@ class File(FileOrDir):
     def _has_writeable_stream(self):
         if isinstance(self.source, (BytesIO, StringIO)):
             return True
-        elif is_url(str(self.source)):
+        elif self._source_is_url:
             return self.fetch_remote
         else:
             return self.source is not None
@@ -73,7 +73,7 @@ class File(FileOrDir):
 
     def write(self, base_path):
         out_file_path = Path(base_path) / unquote(self.id)
-        if isinstance(self.source, (BytesIO, StringIO)) or is_url(str(self.source)):
+        if isinstance(self.source, (BytesIO, StringIO)) or self._source_is_url:
             self._write_from_stream(out_file_path)
         elif self.source is None:
             # Allows to record a File entity whose @id does not exist, see #73
@@ -141,7 +141,7 @@ class File(FileOrDir):
     def stream(self, chunk_size=8192):
         if isinstance(self.source, (BytesIO, StringIO)):
             yield from self._stream_from_stream(self.source)
-        elif is_url(str(self.source)):
+        elif self._source_is_url:
             yield from self._stream_from_url(self.source, chunk_size)
         elif self.source is None:
             # Allows to record a File entity whose @id does not exist, see #73
@@ -50,10 +50,20 @@ class FileOrDir(DataEntity):
         else:
             if not isinstance(source, (str, Path)):
                 raise ValueError("dest_path must be provided if source is not a path or URI")
-            if is_url(str(source)):
+            if self._source_is_url:
                 identifier = os.path.basename(source) if fetch_remote else source
             else:
                 identifier = os.path.basename(str(source).rstrip("/"))
                 if not crate.source:
                     identifier = quote(identifier)
         super().__init__(crate, identifier, properties)
+
+    @property
+    def source(self):
+        return self._source
+
+    @source.setter
+    def source(self, source):
+        self._source = source
+        # checked by write / stream, so parse it only when the source changes
+        self._source_is_url = is_url(str(source))
@@ -25,16 +25,14 @@ from .file import File
 
 class TestDefinition(File):
 
+    _default_type = "TestDefinition"
+
     def _empty(self):
         return {
             "@id": self.id,
             "@type": ['File', 'TestDefinition']
         }
 
-    @property
-    def _default_type(self):
-        return "TestDefinition"
-
     @property
     def engineVersion(self):
         return self.get("engineVersion")
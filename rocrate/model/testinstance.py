@@ -25,16 +25,14 @@ from .contextentity import ContextEntity
 
 class TestInstance(ContextEntity):
 
+    _default_type = "TestInstance"
+
     def _empty(self):
         return {
             "@id": self.id,
             "@type": 'TestInstance'
         }
 
-    @property
-    def _default_type(self):
-        return "TestInstance"
-
     @property
     def name(self):
         return self.get("name")
@@ -25,16 +25,14 @@ from .contextentity import ContextEntity
 
 class TestService(ContextEntity):
 
+    _default_type = "TestService"
+
     def _empty(self):
         return {
             "@id": self.id,
             "@type": 'TestService'
         }
 
-    @property
-    def _default_type(self):
-        return "TestService"
-
     @property
     def name(self):
         return self.get("name")
@@ -25,16 +25,14 @@ from .contextentity import ContextEntity
 
 class TestSuite(ContextEntity):
 
+    _default_type = "TestSuite"
+
     def _empty(self):
         return {
             "@id": self.id,
             "@type": 'TestSuite'
         }
 
-    @property
-    def _default_type(self):
-        return "TestSuite"
-
     @property
     def name(self):
         return self.get("name")
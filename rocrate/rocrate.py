@@ -30,6 +30,9 @@ import tempfile
 import warnings
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, groupby
+from operator import itemgetter
 from pathlib import Path
 from urllib.parse import urljoin
 
@@ -60,20 +63,46 @@ from .model.computerlanguage import get_lang
 from .model.testservice import get_service
 from .model.softwareapplication import get_app
 
-from .utils import is_url, subclasses, get_norm_value, walk, as_list
+from .utils import is_url, subclasses, get_norm_value, walk, as_list, COPY_BUFSIZE
 from .metadata import read_metadata, find_root_entity_id
 
 
+# maximum number of files copied concurrently when writing a crate
+MAX_COPY_WORKERS = 8
+# maximum number of entries in a crate's resolve_id cache
+MAX_RESOLVED_IDS = 4096
+# already compressed formats, stored as they are in ZIP output
+INCOMPRESSIBLE_EXTS = frozenset([
+    ".7z", ".bz2", ".gz", ".jpeg", ".jpg", ".mp4", ".parquet", ".png",
+    ".tgz", ".webm", ".xz", ".zip", ".zst",
+])
+
+
 def pick_type(json_entity, type_map, fallback=None):
     try:
         t = json_entity["@type"]
     except KeyError:
         raise ValueError(f'entity {json_entity["@id"]!r} has no @type')
-    types = {_.strip() for _ in set(t if isinstance(t, list) else [t])}
-    for name, c in type_map.items():
-        if name in types:
-            return c
-    return fallback
+    if not isinstance(t, list):
+        return type_map.get(t.strip(), fallback)
+    matches = [_ for _ in (name.strip() for name in t) if _ in type_map]
+    if not matches:
+        return fallback
+    if len(matches) > 1:
+        # type_map order decides (e.g., most specific class first)
+        return next(c for name, c in type_map.items() if name in matches)
+    return type_map[matches[0]]
+
+
+def _zip_info(path, compression):
+    # like ZipFile.open(path, mode='w'), which uses the ZipInfo defaults
+    # (including the fixed 1980-01-01 timestamp), except for the compression
+    info = zipfile.ZipInfo(path)
+    if os.path.splitext(path)[1].lower() in INCOMPRESSIBLE_EXTS:
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = compression
+    return info
 
 
 class ROCrate():
@@ -82,6 +111,11 @@ class ROCrate():
         self.source = source
         self.exclude = exclude
         self.__entity_map = {}
+        # same keys as __entity_map, split by the categories exposed below
+        self.__default_entity_map = {}
+        self.__data_entity_map = {}
+        self.__contextual_entity_map = {}
+        self.__resolved_ids = {}
         # TODO: add this as @base in the context? At least when loading
         # from zip
         self.uuid = uuid.uuid4()
@@ -102,23 +136,25 @@ class ROCrate():
         self.source = source
 
     def __init_from_tree(self, top_dir, gen_preview=False):
-        top_dir = Path(top_dir)
-        if not top_dir.is_dir():
+        top_dir = os.path.normpath(top_dir)
+        if not os.path.isdir(top_dir):
             raise NotADirectoryError(errno.ENOTDIR, f"'{top_dir}': not a directory")
         self.add(RootDataset(self), Metadata(self))
+        prefix_len = len(os.path.join(top_dir, ""))
         for root, dirs, files in walk(top_dir, exclude=self.exclude):
-            root = Path(root)
             for name in dirs:
-                source = root / name
-                self.add_dataset(source, source.relative_to(top_dir))
+                source = os.path.join(root, name)
+                self.add_dataset(source, source[prefix_len:])
             for name in files:
-                source = root / name
-                if source == top_dir / Metadata.BASENAME or source == top_dir / LegacyMetadata.BASENAME:
-                    continue
-                if source != top_dir / Preview.BASENAME:
-                    self.add_file(source, source.relative_to(top_dir))
-                elif not gen_preview:
-                    self.add(Preview(self, source))
+                source = os.path.join(root, name)
+                if root == top_dir:
+                    if name == Metadata.BASENAME or name == LegacyMetadata.BASENAME:
+                        continue
+                    if name == Preview.BASENAME:
+                        if not gen_preview:
+                            self.add(Preview(self, source))
+                        continue
+                self.add_file(source, source[prefix_len:])
 
     def __read(self, source, gen_preview=False):
         if isinstance(source, dict):
@@ -158,28 +194,36 @@ class ROCrate():
         preview_entity = entities.pop(Preview.BASENAME, None)
         if preview_entity and not gen_preview:
             self.add(Preview(self, source / Preview.BASENAME, properties=preview_entity))
-        self.__add_parts(parts, entities, source)
-
-    def __add_parts(self, parts, entities, source):
         type_map = OrderedDict((_.__name__, _) for _ in subclasses(FileOrDir))
-        for data_entity_ref in parts:
-            id_ = data_entity_ref['@id']
-            try:
-                entity = entities.pop(id_)
-            except KeyError:
-                continue
-            assert id_ == entity.pop('@id')
-            cls = pick_type(entity, type_map, fallback=DataEntity)
-            if cls is DataEntity:
-                instance = DataEntity(self, identifier=id_, properties=entity)
-            else:
-                if is_url(id_):
-                    instance = cls(self, id_, properties=entity)
+        self.__add_parts(parts, entities, source, type_map)
+
+    def __add_parts(self, parts, entities, source, type_map):
+        # iterative depth-first visit (same order as recursing into each
+        # Dataset's hasPart), so deeply nested crates can't hit the
+        # recursion limit
+        stack = [iter(parts)]
+        while stack:
+            for data_entity_ref in stack[-1]:
+                id_ = data_entity_ref['@id']
+                try:
+                    entity = entities.pop(id_)
+                except KeyError:
+                    continue
+                assert id_ == entity.pop('@id')
+                cls = pick_type(entity, type_map, fallback=DataEntity)
+                if cls is DataEntity:
+                    instance = DataEntity(self, identifier=id_, properties=entity)
                 else:
-                    instance = cls(self, source / id_, id_, properties=entity)
-            self.add(instance)
-            if instance.type == "Dataset":
-                self.__add_parts(as_list(entity.get("hasPart", [])), entities, source)
+                    if is_url(id_):
+                        instance = cls(self, id_, properties=entity)
+                    else:
+                        instance = cls(self, source / id_, id_, properties=entity)
+                self.add(instance)
+                if instance.type == "Dataset":
+                    stack.append(iter(as_list(entity.get("hasPart", []))))
+                    break
+            else:
+                stack.pop()
 
     def __read_contextual_entities(self, entities):
         type_map = {_.__name__: _ for _ in subclasses(ContextEntity)}
@@ -194,20 +238,15 @@ class ROCrate():
 
     @property
     def default_entities(self):
-        return [e for e in self.__entity_map.values()
-                if isinstance(e, (RootDataset, Metadata, LegacyMetadata, Preview))]
+        return list(self.__default_entity_map.values())
 
     @property
     def data_entities(self):
-        return [e for e in self.__entity_map.values()
-                if not isinstance(e, (RootDataset, Metadata, LegacyMetadata, Preview))
-                and hasattr(e, "write")]
+        return list(self.__data_entity_map.values())
 
     @property
     def contextual_entities(self):
-        return [e for e in self.__entity_map.values()
-                if not isinstance(e, (RootDataset, Metadata, LegacyMetadata, Preview))
-                and not hasattr(e, "write")]
+        return list(self.__contextual_entity_map.values())
 
     @property
     def name(self):
@@ -313,17 +352,27 @@ class ROCrate():
 
     @property
     def test_suites(self):
-        mentions = [_ for _ in self.root_dataset.get('mentions', []) if isinstance(_, TestSuite)]
-        about = [_ for _ in self.root_dataset.get('about', []) if isinstance(_, TestSuite)]
-        if self.test_dir:
-            legacy_about = [_ for _ in self.test_dir.get('about', []) if isinstance(_, TestSuite)]
-            about += legacy_about
-        return list(set(mentions + about))  # remove any duplicate refs
+        refs = [self.root_dataset.get('mentions', []), self.root_dataset.get('about', [])]
+        test_dir = self.test_dir
+        if test_dir:
+            refs.append(test_dir.get('about', []))
+        # remove any duplicate refs, keeping the order in which they appear
+        return list(dict.fromkeys(_ for _ in chain.from_iterable(refs) if isinstance(_, TestSuite)))
 
     def resolve_id(self, id_):
-        if not is_url(id_):
-            id_ = urljoin(self.arcp_base_uri, id_)  # also does path normalization
-        return id_.rstrip("/")
+        # the result only depends on arcp_base_uri, which is fixed per crate
+        try:
+            return self.__resolved_ids[id_]
+        except KeyError:
+            resolved = id_
+            if not is_url(id_):
+                resolved = urljoin(self.arcp_base_uri, id_)  # also does path normalization
+            resolved = resolved.rstrip("/")
+            # writing probes every unlisted file path, keep the cache bounded
+            if len(self.__resolved_ids) >= MAX_RESOLVED_IDS:
+                self.__resolved_ids.clear()
+            self.__resolved_ids[id_] = resolved
+            return resolved
 
     def get_entities(self):
         return self.__entity_map.values()
@@ -341,8 +390,11 @@ class ROCrate():
         type_ = set(as_list(type_))
         if exact:
             return [_ for _ in self.get_entities() if type_ == set(as_list(_.type))]
-        else:
-            return [_ for _ in self.get_entities() if type_ <= set(as_list(_.type))]
+        if len(type_) == 1:
+            # common case: membership test, no per-entity set allocation
+            t = next(iter(type_))
+            return [_ for _ in self.get_entities() if t == _.type or (isinstance(_.type, list) and t in _.type)]
+        return [_ for _ in self.get_entities() if type_.issubset(as_list(_.type))]
 
     def add_file(
             self,
@@ -386,17 +438,22 @@ class ROCrate():
         if not source:
             raise ValueError("source must refer to an existing local directory")
         top = self.add_dataset(source, dest_path=dest_path)
-        dest_path = Path(top.id).as_posix()
-        for e in os.scandir(source):
-            dest = dest_path / Path(e.path).relative_to(source)
-            if e.is_file():
-                file_ = self.add_file(source=e.path, dest_path=dest)
-                top.append_to("hasPart", file_)
-            if e.is_dir():
-                dir_ = self.add_tree(e.path, dest_path=dest)
-                top.append_to("hasPart", dir_)
+        self.__add_tree(top, os.fspath(source), Path(top.id).as_posix())
         return top
 
+    def __add_tree(self, top, source, dest_prefix):
+        with os.scandir(source) as it:
+            for e in it:
+                dest = f"{dest_prefix}/{e.name}"
+                if e.is_file():
+                    file_ = self.add_file(source=e.path, dest_path=dest)
+                    top.append_to("hasPart", file_)
+                if e.is_dir():
+                    dir_ = self.add_dataset(e.path, dest_path=dest)
+                    # dataset ids are normalized and end with "/"
+                    self.__add_tree(dir_, e.path, dir_.id[:-1])
+                    top.append_to("hasPart", dir_)
+
     def add(self, *entities):
         """\
         Add one or more entities to this RO-Crate.
@@ -412,6 +469,7 @@ class ROCrate():
         """
         for e in entities:
             key = e.canonical_id()
+            bucket = self.__default_entity_map
             if isinstance(e, RootDataset):
                 self.root_dataset = e
             elif isinstance(e, (Metadata, LegacyMetadata)):
@@ -419,9 +477,15 @@ class ROCrate():
             elif isinstance(e, Preview):
                 self.preview = e
             elif hasattr(e, "write"):
+                bucket = self.__data_entity_map
                 if key not in self.__entity_map:
                     self.root_dataset.append_to("hasPart", e)
-            self.__entity_map[key] = e
+            else:
+                bucket = self.__contextual_entity_map
+            if key in self.__entity_map and key not in bucket:
+                # replacing an entity of a different category
+                self.__unindex(key)
+            self.__entity_map[key] = bucket[key] = e
         return entities[0] if len(entities) == 1 else entities
 
     def delete(self, *entities):
@@ -432,53 +496,94 @@ class ROCrate():
         of calling this method, since neither entities pointing to the deleted
         ones nor entities pointed to by the deleted ones are modified.
         """
-        for e in entities:
-            if not isinstance(e, Entity):
-                e = self.dereference(e)
-            if not e:
-                continue
-            if e is self.root_dataset:
-                raise ValueError("cannot delete the root data entity")
-            if e is self.metadata:
-                raise ValueError("cannot delete the metadata entity")
-            if e is self.preview:
-                self.preview = None
-            elif hasattr(e, "write"):
-                self.root_dataset["hasPart"] = [_ for _ in self.root_dataset.get("hasPart", []) if _ != e]
-                if not self.root_dataset["hasPart"]:
-                    del self.root_dataset._jsonld["hasPart"]
-            self.__entity_map.pop(e.canonical_id(), None)
+        removed_parts = set()
+        try:
+            for e in entities:
+                if not isinstance(e, Entity):
+                    e = self.dereference(e)
+                if not e:
+                    continue
+                if e is self.root_dataset:
+                    raise ValueError("cannot delete the root data entity")
+                if e is self.metadata:
+                    raise ValueError("cannot delete the metadata entity")
+                if e is self.preview:
+                    self.preview = None
+                elif hasattr(e, "write"):
+                    removed_parts.add(e.canonical_id())
+                self.__entity_map.pop(e.canonical_id(), None)
+                self.__unindex(e.canonical_id())
+        finally:
+            # filter hasPart once, even when deleting many data entities
+            if removed_parts:
+                self.__remove_parts(removed_parts)
+
+    def __unindex(self, key):
+        for bucket in self.__default_entity_map, self.__data_entity_map, self.__contextual_entity_map:
+            bucket.pop(key, None)
+
+    def __remove_parts(self, canonical_ids):
+        root = self.root_dataset
+        parts = [_ for _ in as_list(root._jsonld.get("hasPart", []))
+                 if not (isinstance(_, dict) and self.resolve_id(_.get("@id", "")) in canonical_ids)]
+        if parts:
+            root._jsonld["hasPart"] = parts
+        else:
+            root._jsonld.pop("hasPart", None)
 
     def _copy_unlisted(self, top, base_path):
-        for root, dirs, files in walk(top, exclude=self.exclude):
-            root = Path(root)
-            for name in dirs:
-                source = root / name
-                dest = base_path / source.relative_to(top)
-                dest.mkdir(parents=True, exist_ok=True)
-            for name in files:
-                source = root / name
-                rel = source.relative_to(top)
-                if not self.dereference(str(rel)):
-                    dest = base_path / rel
-                    if not dest.exists() or not dest.samefile(source):
-                        shutil.copyfile(source, dest)
-
-    def write(self, base_path):
+        # directories are created while walking, file copies run in a pool
+        top = os.path.normpath(top)
+        prefix_len = len(os.path.join(top, ""))
+        with ThreadPoolExecutor(max_workers=MAX_COPY_WORKERS) as executor:
+            futures = []
+            for root, dirs, files in walk(top, exclude=self.exclude):
+                for name in dirs:
+                    rel = os.path.join(root, name)[prefix_len:]
+                    os.makedirs(os.path.join(base_path, rel), exist_ok=True)
+                for name in files:
+                    source = os.path.join(root, name)
+                    rel = source[prefix_len:]
+                    if not self.dereference(rel):
+                        dest = os.path.join(base_path, rel)
+                        if not os.path.exists(dest) or not os.path.samefile(source, dest):
+                            futures.append(executor.submit(shutil.copyfile, source, dest))
+            for f in futures:
+                f.result()
+
+    def write(self, base_path, parallel_write=True):
         base_path = Path(base_path)
         base_path.mkdir(parents=True, exist_ok=True)
         if self.source and not isinstance(self.source, dict):
             self._copy_unlisted(self.source, base_path)
-        for writable_entity in self.data_entities + self.default_entities:
+        if parallel_write:
+            # directory trees can overlap with each other and with listed
+            # files, so they go first, in order (their copies already run
+            # in a pool); each remaining entity writes to its own path
+            data_entities = []
+            for writable_entity in self.data_entities:
+                if isinstance(writable_entity, Dataset):
+                    writable_entity.write(base_path)
+                else:
+                    data_entities.append(writable_entity)
+            with ThreadPoolExecutor(max_workers=MAX_COPY_WORKERS) as executor:
+                futures = [executor.submit(_.write, base_path) for _ in data_entities]
+                for f in futures:
+                    f.result()
+        else:
+            for writable_entity in self.data_entities:
+                writable_entity.write(base_path)
+        # after the data entities, which can update the metadata (e.g., contentSize)
+        for writable_entity in self.default_entities:
             writable_entity.write(base_path)
 
     write_crate = write  # backwards compatibility
 
     def write_zip(self, out_path):
         out_path = Path(out_path)
-        with open(out_path, "wb") as f:
-            for chunk in self._stream_zip(out_path=out_path):
-                f.write(chunk)
+        with zipfile.ZipFile(out_path, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for _ in self._write_zip_entries(archive, chunk_size=COPY_BUFSIZE, out_path=out_path):
+                pass
         return out_path
 
     def stream_zip(self, chunk_size=8192):
@@ -492,41 +597,50 @@ class ROCrate():
         """
         with MemoryBuffer() as buffer:
             with zipfile.ZipFile(buffer, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
-                for writeable_entity in self.data_entities + self.default_entities:
-                    current_file_path, current_out_file = None, None
-                    for path, chunk in writeable_entity.stream(chunk_size=chunk_size):
-                        if path != current_file_path:
-                            if current_out_file:
-                                current_out_file.close()
-                            current_file_path = path
-                            current_out_file = archive.open(path, mode='w', force_zip64=True)
-                        current_out_file.write(chunk)
-                        while len(buffer) >= chunk_size:
-                            yield buffer.read(chunk_size)
-                    if current_out_file:
-                        current_out_file.close()
-
-                # add additional unlisted files to stream
-                listed_files = [archived_file for archived_file in archive.namelist()]
-                for root, dirs, files in walk(str(self.source), exclude=self.exclude):
-                    for name in files:
-                        source = Path(root) / name
-
-                        # ignore out_path to not include a zip in itself
-                        if out_path and out_path.samefile(source):
-                            continue
-
-                        rel = source.relative_to(self.source)
-                        if not self.dereference(str(rel)) and not str(rel) in listed_files:
-                            with archive.open(str(rel), mode='w') as out_file, open(source, 'rb') as in_file:
-                                while chunk := in_file.read(chunk_size):
-                                    out_file.write(chunk)
-                                    while len(buffer) >= chunk_size:
-                                        yield buffer.read(chunk_size)
+                for _ in self._write_zip_entries(archive, chunk_size=chunk_size, out_path=out_path):
+                    while len(buffer) >= chunk_size:
+                        yield buffer.read(chunk_size)
 
             while chunk := buffer.read(chunk_size):
                 yield chunk
 
+    def _write_zip_entries(self, archive, chunk_size=8192, out_path=None):
+        """ Write the content of the RO-Crate to an open ZipFile.
+        This is a generator that yields (None) after each chunk written to the archive, so that callers
+        streaming the archive's underlying buffer can drain it. If out_path is given, the file at that
+        location is not added to the archive.
+        """
+        listed_files = set()
+        for writeable_entity in self.data_entities + self.default_entities:
+            # chunks of a file are streamed one after the other (see DataEntity.stream)
+            stream = writeable_entity.stream(chunk_size=chunk_size)
+            for path, chunks in groupby(stream, key=itemgetter(0)):
+                listed_files.add(path)
+                info = _zip_info(path, archive.compression)
+                with archive.open(info, mode='w', force_zip64=True) as out_file:
+                    for _, chunk in chunks:
+                        out_file.write(chunk)
+                        yield
+
+        # add additional unlisted files to stream
+        top = os.path.normpath(str(self.source))
+        prefix_len = len(os.path.join(top, ""))
+        for root, dirs, files in walk(top, exclude=self.exclude):
+            for name in files:
+                source = os.path.join(root, name)
+
+                # ignore out_path to not include a zip in itself
+                if out_path and out_path.samefile(source):
+                    continue
+
+                rel = source[prefix_len:]
+                if not self.dereference(rel) and rel not in listed_files:
+                    info = _zip_info(rel, archive.compression)
+                    with archive.open(info, mode='w') as out_file, open(source, 'rb') as in_file:
+                        while chunk := in_file.read(chunk_size):
+                            out_file.write(chunk)
+                            yield
+
     def add_workflow(
             self, source=None, dest_path=None, fetch_remote=False, validate_url=False, properties=None,
             main=False, lang="cwl", lang_version=None, gen_cwl=False, cls=ComputationalWorkflow,
@@ -715,8 +829,11 @@ class ROCrate():
         entity: Entity = self.get(entity_id)
         if not entity:
             raise ValueError(f"entity {entity_id} does not exist in the RO-Crate")
-        jsonld = {k: v for k, v in jsonld.items() if not k.startswith('@')}
-        entity._jsonld.update(jsonld)
+        return self.__update_jsonld(entity, jsonld)
+
+    @staticmethod
+    def __update_jsonld(entity, jsonld):
+        entity._jsonld.update({k: v for k, v in jsonld.items() if not k.startswith('@')})
         return entity
 
     def add_or_update_jsonld(self, jsonld):
@@ -732,13 +849,60 @@ class ROCrate():
             ValueError: if the jsonld object is empty or None or if @id was not
               provided.
         """
-        if not jsonld or "@id" not in jsonld:
-            raise ValueError("you must provide a non-empty JSON-LD dictionary")
-        entity_id = jsonld.get("@id")
+        try:
+            entity_id = jsonld["@id"]
+        except (KeyError, TypeError):
+            raise ValueError("you must provide a non-empty JSON-LD dictionary") from None
         entity: Entity = self.get(entity_id)
-        if not entity:
+        if entity is None:
             return self.add_jsonld(jsonld)
-        return self.update_jsonld(jsonld)
+        # already looked up: skip update_jsonld's own lookup
+        del jsonld["@id"]
+        return self.__update_jsonld(entity, jsonld)
+
+    def add_or_update_jsonld_batch(self, jsonlds):
+        """Add or update entities from a sequence of JSON-LD dictionaries.
+
+        Same as calling `add_or_update_jsonld` on each dictionary in order,
+        but all dictionaries are checked before the crate is modified, so
+        an invalid one does not leave the crate partially updated.
+
+        Args:
+            jsonlds: An iterable of JSON-LD dictionaries (e.g., the contents
+              of a `@graph` array).
+        Return:
+            The list of added or updated entities, in the same order.
+        Raises:
+            ValueError: if any of the jsonld objects is not a dictionary or
+              has no @id, or if an entity that is not in the RO-Crate yet
+              has no @type or can't be built from its properties (e.g., a
+              reference without @id).
+        """
+        # nothing is added or updated until every entry has been checked;
+        # new entities are built (and so validated by their constructor)
+        # in the first pass
+        plan = []  # (entity, properties to update or None to add it)
+        new_entities = {}
+        for jsonld in jsonlds:
+            if not isinstance(jsonld, dict) or "@id" not in jsonld:
+                raise ValueError("you must provide non-empty JSON-LD dictionaries")
+            properties = dict(jsonld)  # the same dict could appear again
+            entity_id = properties.pop("@id")
+            canonical_id = self.resolve_id(entity_id)
+            entity = self.__entity_map.get(canonical_id) or new_entities.get(canonical_id)
+            if entity is not None:
+                plan.append((entity, properties))
+                continue
+            if "@type" not in properties:
+                raise ValueError(f"entity {entity_id} is not in the RO-Crate and has no @type")
+            entity = new_entities[canonical_id] = ContextEntity(self, entity_id, properties=properties)
+            plan.append((entity, None))
+        for entity, properties in plan:
+            if properties is None:
+                self.add(entity)
+            else:
+                self.__update_jsonld(entity, properties)
+        return [entity for entity, _ in plan]
 
     def __validate_suite(self, suite):
         if isinstance(suite, TestSuite):
@@ -750,7 +914,7 @@ class ROCrate():
         return suite
 
 
-def make_workflow_rocrate(workflow_path, wf_type, include_files=[],
+def make_workflow_rocrate(workflow_path, wf_type, include_files=(),
                           fetch_remote=False, cwl=None, diagram=None):
     wf_crate = ROCrate()
     workflow_path = Path(workflow_path)
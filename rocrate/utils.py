@@ -26,6 +26,12 @@ import os
 from datetime import datetime, timezone
 from urllib.parse import urlsplit
 
+from dateutil.parser import isoparse
+
+
+# buffer size for bulk file I/O (e.g., copying files, downloading remote data)
+COPY_BUFSIZE = 1024 * 1024
+
 
 def as_list(value):
     if isinstance(value, list):
@@ -44,6 +50,21 @@ def iso_now():
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+def parse_iso(string):
+    """\
+    Parse an ISO 8601 date or datetime string.
+
+    Tries the C-implemented datetime.fromisoformat first, which handles the
+    format produced by iso_now, and falls back to dateutil's more general
+    parser for other ISO 8601 variants (e.g. the basic format, or "Z" on
+    Python < 3.11).
+    """
+    try:
+        return datetime.fromisoformat(string)
+    except ValueError:
+        return isoparse(string)
+
+
 def subclasses(cls):
     """\
     Recursively iterate through all subclasses (direct and indirect) of cls.
@@ -229,3 +229,60 @@ def test_add_or_update_update_jsonld(test_data_dir):
     assert entity_added.id == updated_entity.id
     assert entity_added.type == updated_entity.type
     assert updated_entity['name'] == 'No potatoes today'
+
+
+def test_add_or_update_jsonld_batch(test_data_dir):
+    crate_dir = test_data_dir / 'read_crate'
+    crate = ROCrate(crate_dir)
+    n_entities = len(list(crate.get_entities()))
+
+    new_entity_id = f'#{uuid4()}'
+    entities = crate.add_or_update_jsonld_batch([
+        {'@id': './', 'author': {'@id': new_entity_id}},
+        {'@id': new_entity_id, '@type': 'Person', 'name': 'Bob Doe'},
+        {'@id': new_entity_id, 'name': 'Bob K. Doe'},
+    ])
+    new_entity = crate.get(new_entity_id)
+    assert entities == [crate.root_dataset, new_entity, new_entity]
+    assert new_entity.type == 'Person'
+    assert new_entity['name'] == 'Bob K. Doe'
+    assert crate.root_dataset['author'] is new_entity
+    assert len(list(crate.get_entities())) == n_entities + 1
+
+    assert crate.add_or_update_jsonld_batch([]) == []
+
+
+@pytest.mark.parametrize("invalid", [
+    None, {}, ['@id'], {'name': 'foo'}, {'@id': '#no-type'},
+    {'@id': '#no-ref-id', '@type': 'Person', 'affiliation': [{'@id': '#org'}, {'name': 'Org'}]},
+])
+def test_add_or_update_jsonld_batch_raises(test_data_dir, invalid):
+    crate_dir = test_data_dir / 'read_crate'
+    crate = ROCrate(crate_dir)
+    new_entity_id = f'#{uuid4()}'
+
+    with pytest.raises(ValueError):
+        crate.add_or_update_jsonld_batch([
+            {'@id': './', 'name': 'Changed'},
+            {'@id': new_entity_id, '@type': 'Person'},
+            invalid
+        ])
+    assert crate.root_dataset.get('name') != 'Changed'
+    assert crate.get(new_entity_id) is None
+
+
+def test_add_or_update_jsonld_batch_same_dict(test_data_dir):
+    crate_dir = test_data_dir / 'read_crate'
+    crate = ROCrate(crate_dir)
+    new_entity_id = f'#{uuid4()}'
+
+    root = {'@id': './', 'name': 'Changed'}
+    person = {'@id': new_entity_id, '@type': 'Person', 'name': 'Bob Doe'}
+    entities = crate.add_or_update_jsonld_batch([root, person, person, root])
+    new_entity = crate.get(new_entity_id)
+    assert entities == [crate.root_dataset, new_entity, new_entity, crate.root_dataset]
+    assert new_entity['name'] == 'Bob Doe'
+    assert crate.root_dataset['name'] == 'Changed'
+    # the caller's dicts are left untouched
+    assert root == {'@id': './', 'name': 'Changed'}
+    assert person == {'@id': new_entity_id, '@type': 'Person', 'name': 'Bob Doe'}
@@ -300,6 +300,19 @@ def test_delete_by_id(test_data_dir):
     assert "hasPart" not in crate.root_dataset
 
 
+def test_delete_many(test_data_dir):
+    crate = ROCrate()
+    files = [crate.add_file(test_data_dir / "sample_file.txt", f"{i}.txt") for i in range(5)]
+    dataset = crate.add_dataset(test_data_dir / "test_add_dir")
+    crate.delete(files[1], files[3].id, dataset)
+    for f in files[1], files[3], dataset:
+        assert f not in crate.data_entities
+    assert crate.root_dataset["hasPart"] == [files[0], files[2], files[4]]
+    with pytest.raises(ValueError):
+        crate.delete(files[0], crate.root_dataset)
+    assert crate.root_dataset["hasPart"] == [files[2], files[4]]
+
+
 def test_self_delete(test_data_dir):
     crate = ROCrate()
     path = test_data_dir / "sample_file.txt"
@@ -552,3 +565,14 @@ def test_entity_in_properties(tmpdir):
     assert out_authors[1] is out_bob
     assert out_alice == alice
     assert out_bob == bob
+
+
+def test_resolve_id_cache_bounded(monkeypatch):
+    monkeypatch.setattr("rocrate.rocrate.MAX_RESOLVED_IDS", 10)
+    crate = ROCrate()
+    f = crate.add_file("/foo/bar.txt", "bar.txt")
+    for i in range(25):
+        assert crate.dereference(f"unlisted/{i}.txt") is None
+    assert len(crate._ROCrate__resolved_ids) <= 10
+    assert crate.dereference("bar.txt") is f
+    assert crate.resolve_id("bar.txt") == f.canonical_id()
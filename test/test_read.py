@@ -23,12 +23,14 @@
 import json
 import pytest
 import shutil
+import sys
 import uuid
 import zipfile
+from collections import OrderedDict
 from pathlib import Path
 
-from rocrate.rocrate import ROCrate
-from rocrate.model import DataEntity, File, Dataset
+from rocrate.rocrate import ROCrate, pick_type
+from rocrate.model import DataEntity, File, Dataset, ComputationalWorkflow
 
 _URL = ('https://raw.githubusercontent.com/ResearchObject/ro-crate-py/master/'
         'test/test-data/sample_file.txt')
@@ -662,3 +664,42 @@ def test_no_data_entity_link_from_file():
     assert t1
     assert t1 not in crate.data_entities
     assert t1 in crate.contextual_entities
+
+
+def test_deeply_nested_data_entities():
+    depth = sys.getrecursionlimit() + 100
+    ids = ["/".join(f"d{i}" for i in range(n + 1)) + "/" for n in range(depth)]
+    graph = [
+        {
+            "@id": "ro-crate-metadata.json",
+            "@type": "CreativeWork",
+            "about": {"@id": "./"},
+            "conformsTo": {"@id": "https://w3id.org/ro/crate/1.1"}
+        },
+        {
+            "@id": "./",
+            "@type": "Dataset",
+            "hasPart": [{"@id": ids[0]}]
+        }
+    ]
+    for id_, part in zip(ids, ids[1:] + [None]):
+        entity = {"@id": id_, "@type": "Dataset"}
+        if part:
+            entity["hasPart"] = [{"@id": part}]
+        graph.append(entity)
+    crate = ROCrate({"@context": "https://w3id.org/ro/crate/1.1/context", "@graph": graph})
+    assert [_.id for _ in crate.data_entities] == ids
+
+
+def test_pick_type():
+    type_map = OrderedDict((_.__name__, _) for _ in (ComputationalWorkflow, File, Dataset))
+    assert pick_type({"@type": "File"}, type_map) is File
+    assert pick_type({"@type": " Dataset "}, type_map) is Dataset
+    assert pick_type({"@type": "Thing"}, type_map) is None
+    assert pick_type({"@type": ["Thing"]}, type_map, fallback=DataEntity) is DataEntity
+    assert pick_type({"@type": ["File", "SoftwareSourceCode"]}, type_map) is File
+    # type_map order wins over the order of the entity's types
+    t = ["File", "SoftwareSourceCode", "ComputationalWorkflow"]
+    assert pick_type({"@type": t}, type_map) is ComputationalWorkflow
+    with pytest.raises(ValueError):
+        pick_type({"@id": "foo"}, type_map)
@@ -20,9 +20,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
+
 import pytest
 
-from rocrate.utils import subclasses, get_norm_value, is_url
+from rocrate.utils import subclasses, get_norm_value, is_url, iso_now, parse_iso
 
 
 class Pet:
@@ -66,3 +68,16 @@ def test_is_url():
     assert not is_url("/etc/")
     assert not is_url("/etc")
     assert not is_url("/")
+
+
+def test_parse_iso():
+    utc = datetime.timezone.utc
+    expected = datetime.datetime(2021, 6, 15, 10, 30, 0, tzinfo=utc)
+    assert parse_iso("2021-06-15T10:30:00+00:00") == expected
+    assert parse_iso("2021-06-15T10:30:00Z") == expected
+    assert parse_iso("20210615T103000Z") == expected
+    assert parse_iso("2021-06-15") == datetime.datetime(2021, 6, 15)
+    now = parse_iso(iso_now())
+    assert now.tzinfo is not None
+    with pytest.raises(ValueError):
+        parse_iso("not a date")
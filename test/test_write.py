@@ -21,16 +21,22 @@
 # limitations under the License.
 
 import io
+import ntpath
+import posixpath
 import pytest
 import requests
 import os
+import threading
 import uuid
 import sys
 import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from itertools import product
-from urllib.error import URLError
+from types import SimpleNamespace
+from urllib.error import HTTPError, URLError
 
 from rocrate.model import Dataset, Person
+from rocrate.model import dataset as dataset_module
 from rocrate.rocrate import ROCrate
 
 
@@ -194,6 +200,82 @@ def test_file_uri(tmpdir):
     assert (out_path / f_name).is_file()
 
 
+def test_dataset_file_uri(tmpdir):
+    d_path = (tmpdir / "remote").resolve()
+    d_path.mkdir()
+    (d_path / "a.txt").write_text("FOO\n", encoding="utf-8")
+    (d_path / "empty.txt").write_text("", encoding="utf-8")
+    d_uri = f"file:///{d_path}"  # extra slash needed on some windows systems
+    crate = ROCrate()
+    crate.add_dataset(d_uri, "d", fetch_remote=True, properties={
+        "hasPart": [{"@id": "a.txt"}, {"@id": "empty.txt"}],
+    })
+
+    out_path = tmpdir / 'ro_crate_out'
+    crate.write(out_path)
+    assert (out_path / "d" / "a.txt").read_text(encoding="utf-8") == "FOO\n"
+    assert (out_path / "d" / "empty.txt").read_text(encoding="utf-8") == ""
+
+
+def test_dataset_file_uri_missing_part(tmpdir):
+    d_path = (tmpdir / "remote").resolve()
+    d_path.mkdir()
+    d_uri = f"file:///{d_path}"
+    crate = ROCrate()
+    crate.add_dataset(d_uri, "d", fetch_remote=True, properties={
+        "hasPart": [{"@id": "nope.txt"}],
+    })
+    with pytest.raises(URLError):
+        crate.write(tmpdir / 'ro_crate_out')
+    with pytest.raises(URLError):
+        for _ in crate.stream_zip():
+            pass
+
+
+class _GetOnlyHandler(BaseHTTPRequestHandler):
+
+    def send_head(self):
+        code = 404 if self.path.startswith("/missing") else 200
+        self.send_response(code)
+        self.send_header("Content-Length", "3")
+        self.end_headers()
+        return code
+
+    def do_GET(self):
+        if self.send_head() == 200:
+            self.wfile.write(b"foo")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _HeadGetHandler(_GetOnlyHandler):
+
+    def do_HEAD(self):
+        self.send_head()
+
+
+@pytest.mark.parametrize("handler", [_GetOnlyHandler, _HeadGetHandler])
+def test_dataset_validate_url(tmpdir, handler):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        base = f"http://127.0.0.1:{server.server_port}"
+        crate = ROCrate()
+        dataset = crate.add_dataset(f"{base}/data/", validate_url=True)
+        crate.write(tmpdir / "ro_crate_out_1")
+        assert "sdDatePublished" in dataset
+
+        crate = ROCrate()
+        crate.add_dataset(f"{base}/missing/", validate_url=True)
+        with pytest.raises(HTTPError) as exc_info:
+            crate.write(tmpdir / "ro_crate_out_2")
+        assert exc_info.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 @pytest.mark.skipif(os.name != "posix", reason="':' not allowed in dir name")
 def test_looks_like_file_uri(tmpdir, monkeypatch):
     f_name = uuid.uuid4().hex
@@ -385,6 +467,26 @@ def test_dataset(test_data_dir, tmpdir):
     assert (out_path / "c").is_dir()
 
 
+@pytest.mark.parametrize("parallel_write", [False, True])
+def test_parallel_write(test_data_dir, tmpdir, helpers, parallel_write):
+    crate = ROCrate()
+    crate.add_dataset(test_data_dir / "read_extra", "extra")
+    sizes = {}
+    for name in "abcdefghij":
+        id_ = f"extra/{name}.txt"
+        sizes[id_] = str(len(name) * 100)
+        crate.add_file(io.StringIO(name * 100), id_, record_size=True)
+    out_path = tmpdir / 'ro_crate_out'
+    crate.write(out_path, parallel_write=parallel_write)
+
+    assert (out_path / "extra" / "listed" / "listed.txt").is_file()
+    for id_, size in sizes.items():
+        assert (out_path / id_).stat().st_size == int(size)
+    json_entities = helpers.read_json_entities(out_path)
+    helpers.check_crate(json_entities)
+    assert {id_: json_entities[id_]["contentSize"] for id_ in sizes} == sizes
+
+
 def test_no_parts(tmpdir, helpers):
     crate = ROCrate()
 
@@ -397,6 +499,29 @@ def test_no_parts(tmpdir, helpers):
     assert "hasPart" not in json_entities["./"]
 
 
+def test_copy_unlisted_keeps_dir_mode(tmpdir):
+    src = tmpdir / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "sub" / "unlisted.txt").write_text("foo")
+    ROCrate().write(src)
+    ref = tmpdir / "ref"
+    ref.mkdir()
+    expected_mode = ref.stat().st_mode & 0o777
+    (src / "sub").chmod(0o555)
+    src.chmod(0o555)
+    try:
+        crate = ROCrate(src)
+        out_path = tmpdir / "ro_crate_out"
+        crate.write(out_path)
+    finally:
+        src.chmod(0o755)
+        (src / "sub").chmod(0o755)
+    assert (out_path / "sub" / "unlisted.txt").read_text() == "foo"
+    assert (out_path / "ro-crate-metadata.json").is_file()
+    assert out_path.stat().st_mode & 0o777 == expected_mode
+    assert (out_path / "sub").stat().st_mode & 0o777 == expected_mode
+
+
 def test_write_zip_copy_unlisted(test_data_dir, tmpdir):
     crate_dir = test_data_dir / 'ro-crate-galaxy-sortchangecase'
     crate = ROCrate(crate_dir)
@@ -481,6 +606,36 @@ def test_http_header(tmpdir):
         assert props["sdDatePublished"] == response.headers.get("last-modified")
 
 
+@pytest.mark.parametrize("path_module,top,rel", [
+    (posixpath, "/data", "data/a.txt"),
+    (posixpath, "/srv/data", "data/a.txt"),
+    (posixpath, "data", "data/a.txt"),
+    (ntpath, "C:\\data", "data\\a.txt"),
+    (ntpath, "C:\\srv\\data", "data\\a.txt"),
+])
+def test_parent_prefix_len(monkeypatch, path_module, top, rel):
+    # only the dataset module sees the other platform's os.path
+    monkeypatch.setattr(dataset_module, "os", SimpleNamespace(path=path_module))
+    source = path_module.join(top, "a.txt")
+    assert source[dataset_module._parent_prefix_len(top):] == rel
+
+
+@pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() == 0, reason="permissions not enforced")
+def test_stream_dataset_unreadable_subdir(tmpdir):
+    top = tmpdir / "top"
+    (top / "locked").mkdir(parents=True)
+    (top / "a.txt").write_text("foo")
+    (top / "locked" / "b.txt").write_text("bar")
+    (top / "locked").chmod(0)
+    try:
+        crate = ROCrate()
+        dataset = crate.add_dataset(top)
+        paths = {path for path, _ in dataset.stream()}
+    finally:
+        (top / "locked").chmod(0o755)
+    assert paths == {os.path.join("top", "a.txt")}
+
+
 def test_stream(test_data_dir, tmpdir):
     source = test_data_dir / "read_crate"
     crate = ROCrate(source)
@@ -503,6 +658,39 @@ def test_stream(test_data_dir, tmpdir):
     assert (extract_path / "test" / "test-metadata.json").is_file()
 
 
+@pytest.mark.parametrize("stream", [False, True])
+def test_zip_stored_exts(tmpdir, stream):
+    crate_dir = tmpdir / "crate"
+    crate_dir.mkdir()
+    crate = ROCrate()
+    payload = b"\0" * 10000
+    for name in "listed.txt", "listed.PNG", "unlisted.gz", "unlisted.txt":
+        (crate_dir / name).write_bytes(payload)
+    crate.add_file(crate_dir / "listed.txt")
+    crate.add_file(crate_dir / "listed.PNG")
+    crate.write(crate_dir)
+    crate = ROCrate(crate_dir)
+
+    out_path = tmpdir / 'ro_crate_out.zip'
+    if stream:
+        with open(out_path, "wb") as out:
+            for chunk in crate.stream_zip():
+                out.write(chunk)
+    else:
+        crate.write_zip(out_path)
+
+    with zipfile.ZipFile(out_path, "r") as zf:
+        assert not zf.testzip()
+        types = {_.filename: _.compress_type for _ in zf.infolist()}
+        # same timestamp ZipFile.open(name, mode='w') gives
+        assert {_.date_time for _ in zf.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+        for name in "listed.PNG", "unlisted.gz":
+            assert types[name] == zipfile.ZIP_STORED
+            assert zf.read(name) == payload
+        for name in "listed.txt", "unlisted.txt", "ro-crate-metadata.json":
+            assert types[name] == zipfile.ZIP_DEFLATED
+
+
 def test_percent_escape(test_data_dir, tmpdir, helpers):
     crate = ROCrate()
     f_path = test_data_dir / "read_crate" / "with space.txt"